@@ -34,6 +34,15 @@ class DList:
 
     # ------------------------------------------------------------------
 
+    def __del__(self):
+        """breaks the links between the nodes when the list is discarded"""
+        # a list built through __new__ without __init__ (e.g., a failed deepcopy or
+        # unpickle) has no head and so no nodes to unlink
+        if getattr(self, "head", None) is not None:
+            self.clear()
+
+    # ------------------------------------------------------------------
+
     def __len__(self) -> int:
         """returns number of items in the list"""
         return self.size
@@ -102,13 +111,22 @@ class DList:
 
     # ------------------------------------------------------------------
 
-    def __setitem__(self, position: int, value: Item):
+    def __setitem__(self, position: Union[int, slice], value: Union[Item, Iterable]):
         """
-        set the value at the specified position; raises IndexError if position out of range
-        :param position: index to set the value at
-        :param value: value to put at the position
+        set the value at the specified position; raises IndexError if position out of range;
+        assigning an iterable to an empty slice (items[i:i] = seq) inserts its items at i
+        :param position: index to set the value at or an empty slice to insert at
+        :param value: value to put at the position or iterable of values to insert
         :return: None
         """
+        if isinstance(position, slice):
+            start, stop, step = position.indices(self.size)
+            # only empty slices are supported, so that the assignment is an insertion
+            if step != 1 or stop > start:
+                raise ValueError("only assignment to an empty slice is supported")
+            self.insert_many(start, value)
+            return
+
         # calls _find to retrieve the node at the position
         node = self._find(position)
         # changes the value of the node
@@ -142,8 +160,14 @@ class DList:
         node = self._find(position)
         item = node.item
 
+        # if removing the only node
+        if self.size == 1:
+            self.head = None
+            self.tail = None
+            self.size -= 1
+
         # if removing the head
-        if position == 0 or position == 0 - self.size:
+        elif position == 0 or position == 0 - self.size:
             tempNode = node.next
             node.next = None
             tempNode.prev = None
@@ -180,6 +204,15 @@ class DList:
         removes all element from the list
         :return: None
         """
+        # break the links between the nodes so reference counting frees each
+        # node right away instead of leaving prev/next cycles for the garbage collector
+        node = self.head
+        while node is not None:
+            nextNode = node.next
+            node.prev = None
+            node.next = None
+            node = nextNode
+
         # set the head and tail to None, and set the size to 0
         self.tail = None
         self.head = None
@@ -254,6 +287,82 @@ class DList:
 
     # ------------------------------------------------------------------
 
+    def insert_many(self, position: int, seq: Iterable):
+        """
+        inserts the items in seq starting at the specified position, locating the position only once;
+        follows the same rules as insert, so a position beyond the end adds to the end of the list and
+        any negative position inserts at the beginning (unlike items[i:i] = seq, which counts negative
+        indices from the end)
+        :param position: index to insert the first item at
+        :param seq: the iterable sequence of items to insert
+        :return: None
+        """
+        # builds the chain of new nodes before linking any of them in,
+        # so inserting a list into itself does not loop forever
+        first = last = None
+        count = 0
+        try:
+            for x in seq:
+                newNode = DListNode(x, last)
+                if last is None:
+                    first = newNode
+                else:
+                    last.next = newNode
+                last = newNode
+                count += 1
+
+        # if seq raises partway through, break the links of the partial chain
+        # so its nodes are not left for the garbage collector
+        except BaseException:
+            node = first
+            while node is not None:
+                nextNode = node.next
+                node.prev = None
+                node.next = None
+                node = nextNode
+            raise
+
+        # nothing to insert
+        if count == 0:
+            return
+
+        # if list is empty, the chain becomes the list
+        if self.size == 0:
+            self.head = first
+            self.tail = last
+
+        # if the position is beyond the end, add the chain after the tail
+        elif position > self.size - 1:
+            self.tail.next = first
+            first.prev = self.tail
+            self.tail = last
+
+        else:
+            # if the position is beyond the beginning, insert the chain at head
+            if position < 0:
+                position = 0
+
+            # if inserting at the head
+            if position == 0:
+                node = self.head
+                node.prev = last
+                last.next = node
+                self.head = first
+
+            # if inserting in the middle
+            else:
+                # use _find to retrieve the node at the position
+                node = self._find(position)
+                prevNode = node.prev
+                first.prev = prevNode
+                last.next = node
+                node.prev = last
+                prevNode.next = first
+
+        self.size += count
+
+    # ------------------------------------------------------------------
+
     def pop(self, position=-1) -> Item:
         """
         removes and returns the item at the index specified by position; raises IndexError if position out of range
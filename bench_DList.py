@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# ----------------------------------------------------------------------
+# bench_DList.py
+# measures garbage collector pauses and collection counts when large
+# DLists are cleared or discarded
+# ----------------------------------------------------------------------
+
+import gc
+import time
+
+from DList import *
+
+
+# ----------------------------------------------------------------------
+
+def unlinkedDiscard(items: DList):
+    """drops the list without breaking the node links (the old behavior)"""
+    items.head = None
+    items.tail = None
+    items.size = 0
+
+# ----------------------------------------------------------------------
+
+def discardOnly(items: DList):
+    """leaves the teardown to DList.__del__ when the list is deleted"""
+    pass
+
+# ----------------------------------------------------------------------
+
+def run(name: str, discard, n: int, rounds: int):
+    """
+    builds and discards rounds DLists of n items with automatic garbage
+    collection enabled and reports the pauses and collections of the
+    garbage collector while doing so
+    :param name: label for the output
+    :param discard: function that tears down the list before it is deleted
+    :param n: number of items in each list
+    :param rounds: number of lists to build and discard
+    :return: None
+    """
+    pauses = []
+    collected = 0
+    collections = [0] * len(gc.get_stats())
+    started = []
+
+    def record(phase: str, info: dict):
+        """timestamps each collection and records its generation and objects collected"""
+        nonlocal collected
+        if phase == "start":
+            started.append(time.perf_counter())
+        else:
+            pauses.append(time.perf_counter() - started.pop())
+            collections[info["generation"]] += 1
+            collected += info["collected"]
+
+    # starts each case with no garbage left over from the previous one
+    gc.collect()
+    gc.callbacks.append(record)
+    try:
+        for _ in range(rounds):
+            items = DList(range(n))
+            discard(items)
+            del items
+    finally:
+        gc.callbacks.remove(record)
+
+    maxPause = max(pauses, default=0)
+    meanPause = sum(pauses) / len(pauses) if pauses else 0
+    print(f"{name:>10}: max pause {maxPause * 1000:8.2f} ms, "
+          f"mean pause {meanPause * 1000:8.2f} ms, "
+          f"objects collected {collected}, collections per generation {collections}")
+
+# ----------------------------------------------------------------------
+
+def main():
+    n = 20000
+    rounds = 100
+    run("before", unlinkedDiscard, n, rounds)
+    run("clear", DList.clear, n, rounds)
+    run("del", discardOnly, n, rounds)
+
+# ----------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,21 @@
 
 # ----------------------------------------------------------------------
 import copy
+import gc
 import sys
 import unittest
+import weakref
 
 sys.path.insert(0, '..')
 from DList import *
 
 
+# ----------------------------------------------------------------------
+
+class Marker:
+
+    """weak-referenceable item for checking that nodes are freed"""
+
 # ----------------------------------------------------------------------
 
 class DListTest(unittest.TestCase):
@@ -94,6 +102,35 @@ class DListTest(unittest.TestCase):
         items[2] = 9
         self.assertEqual(items[2], 9)
 
+    def testSetItemEmptySlice(self):
+
+        items = DList([1, 2, 3])
+
+        # Checks assigning to an empty slice inserts the items
+        items[1:1] = [7, 8]
+        self.checkList(items, [1, 7, 8, 2, 3])
+        items[-1:-1] = [9]
+        self.checkList(items, [1, 7, 8, 2, 9, 3])
+        items[10:] = [4]
+        self.checkList(items, [1, 7, 8, 2, 9, 3, 4])
+        items[:0] = [0]
+        self.checkList(items, [0, 1, 7, 8, 2, 9, 3, 4])
+
+        # Checks non-empty slices are rejected
+        with self.assertRaises(ValueError):
+            items[1:3] = [5]
+        self.checkList(items, [0, 1, 7, 8, 2, 9, 3, 4])
+
+        # Checks the list is unchanged if the sequence raises partway through
+        def failing():
+            yield 5
+            yield 6
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            items[2:2] = failing()
+        self.checkList(items, [0, 1, 7, 8, 2, 9, 3, 4])
+
 # ----------------------------------------------------------------------
     # delItem Tests
 
@@ -116,6 +153,11 @@ class DListTest(unittest.TestCase):
 
         self.checkList(items, [7, 1])
 
+        # Checks deleting the only item empties the list
+        items = DList([5])
+        del items[0]
+        self.checkList(items, [])
+
 # ----------------------------------------------------------------------
 
 # clear() Tests
@@ -125,10 +167,61 @@ class DListTest(unittest.TestCase):
         items = DList()
         items.extend([8, 4, 2, 4, 1, 6, 8])
 
+        first = items.head
+        second = first.next
+        last = items.tail
+
         items.clear()
 
         self.checkList(items, [])
 
+        # Checks the nodes were unlinked from each other
+        self.assertIsNone(first.next)
+        self.assertIsNone(second.prev)
+        self.assertIsNone(second.next)
+        self.assertIsNone(last.prev)
+
+    def testClearNoCycles(self):
+
+        # disables the garbage collector so only reference counting can free the nodes
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        items = DList(range(100))
+        node = weakref.ref(items.head.next)
+
+        items.clear()
+
+        # Checks the nodes were freed without the garbage collector
+        self.assertIsNone(node())
+
+    def testDiscardNoCycles(self):
+
+        # disables the garbage collector so only reference counting can free the nodes
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        items = DList(range(100))
+        node = weakref.ref(items.head.next)
+
+        del items
+
+        # Checks discarding the list freed the nodes without the garbage collector
+        self.assertIsNone(node())
+
+    def testDiscardUninitialized(self):
+
+        items = DList.__new__(DList)
+        hook = sys.unraisablehook
+        errors = []
+        sys.unraisablehook = errors.append
+        self.addCleanup(setattr, sys, "unraisablehook", hook)
+
+        del items
+
+        # Checks discarding a list that was never initialized raises nothing
+        self.assertEqual(errors, [])
+
 # ----------------------------------------------------------------------
 
 # insert() Tests
@@ -149,6 +242,47 @@ class DListTest(unittest.TestCase):
 
 # ----------------------------------------------------------------------
 
+# insert_many() Tests
+
+    def testInsertMany(self):
+        items = DList()
+        items.insert_many(2, [])
+        self.checkList(items, [])
+        items.insert_many(2, [1, 2])
+        self.checkList(items, [1, 2])
+        items.insert_many(0, [3, 4])
+        self.checkList(items, [3, 4, 1, 2])
+        items.insert_many(-9, [5])
+        self.checkList(items, [5, 3, 4, 1, 2])
+        items.insert_many(2, (6, 7))
+        self.checkList(items, [5, 3, 6, 7, 4, 1, 2])
+        items.insert_many(20, [8, 9])
+        self.checkList(items, [5, 3, 6, 7, 4, 1, 2, 8, 9])
+        items.insert_many(1, items)
+        self.checkList(items, [5, 5, 3, 6, 7, 4, 1, 2, 8, 9, 3, 6, 7, 4, 1, 2, 8, 9])
+
+        # Checks the partial chain is freed without the garbage collector
+        gc.disable()
+        self.addCleanup(gc.enable)
+        items = DList([1, 2, 3])
+        refs = []
+
+        def failingObjects():
+            for i in range(2):
+                obj = Marker()
+                refs.append(weakref.ref(obj))
+                yield obj
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            items.insert_many(2, failingObjects())
+        self.checkList(items, [1, 2, 3])
+        self.assertEqual(len(refs), 2)
+        for ref in refs:
+            self.assertIsNone(ref())
+
+# ----------------------------------------------------------------------
+
 # pop() Tests
 
     def testPop(self):